@@ -1,9 +1,13 @@
-import os, json, sys, shutil, re, webbrowser, threading
+import os, json, sys, shutil, re, webbrowser, threading, errno, filecmp
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, filedialog
 from tkinter.scrolledtext import ScrolledText
 import urllib.request, urllib.error
+from concurrent.futures import ThreadPoolExecutor
+
+try: import fcntl  # reflinks (FICLONE) are Linux-only
+except ImportError: fcntl = None
 
 
 class Folderer(tk.Tk):
@@ -20,11 +24,20 @@ class Folderer(tk.Tk):
         "forest": dict(bg="#06110B", text="#E7F2EA", muted="#A9C4B2", entry="#0A1A12", btn="#0E2418", border="#1B3A2A"),
     }
 
+    # Folder Files modes: move the originals, or link them in and leave them where they are
+    FOLDER_MODES = ("Move", "Hardlink", "Reflink", "Symlink")
+    LINK_CHAINS = {"Hardlink": ("hardlink", "symlink"), "Reflink": ("reflink", "symlink"), "Symlink": ("symlink",)}
+    FICLONE = 0x40049409  # linux/fs.h
+    # Only "this kind of link can't be made here" falls back; EPERM/EACCES/EMLINK etc. are real errors
+    LINK_FALLBACK_ERRNOS = {errno.EXDEV, errno.EOPNOTSUPP, errno.ENOTSUP}
+
+    SNAPSHOT_REFRESH_MS = 5000  # background rescan of the target for the preview's conflict counts
+
     def __init__(self):
         super().__init__()
         self.title("Folderer")
-        self.geometry("760x520")
-        self.minsize(700, 470)
+        self.geometry("760x560")
+        self.minsize(700, 510)
 
         # Vars
         self.base = tk.StringVar(value="New Folder")
@@ -34,6 +47,8 @@ class Folderer(tk.Tk):
         self.start = tk.StringVar(value="1")
         self.sep = tk.StringVar(value=" ")
         self.pad = tk.StringVar(value="0")  # zero-pad width (0=no padding, 2=01, 3=001)
+        self.folder_mode = tk.StringVar(value="Move")  # Folder Files: Move/Hardlink/Reflink/Symlink
+        self.template = tk.StringVar(value="")  # optional folder whose contents seed each created folder
 
         self.theme = tk.StringVar(value="Light")  # Light/Dark/Forest
         self.default_path = tk.StringVar(value=str(Path.cwd()))
@@ -45,11 +60,14 @@ class Folderer(tk.Tk):
         self.style = ttk.Style(self)
         self._after_preview = None
         self._icon_img = None
+        self._snap = None  # (target, dir mtime_ns, frozenset of normcased names)
+        self._snap_busy = False
         self._c = self.THEMES["dark"]  # active theme colors
 
         self.gear_btn = self.back_btn = None
         self.update_btn = None
         self._update_checking = False
+        self._seeding = False
 
         self._load_settings()
         self._ui()
@@ -60,6 +78,7 @@ class Folderer(tk.Tk):
         self._toggle_numbering()
         self._schedule_preview()
         self._show(self.main)
+        self.after(self.SNAPSHOT_REFRESH_MS, self._snapshot_tick)
 
     # ---------- icon ----------
     def _resource_path(self, name: str) -> Path:
@@ -193,7 +212,7 @@ class Folderer(tk.Tk):
     def _ui_main(self):
         m = self.main
         m.columnconfigure(1, weight=1)
-        m.rowconfigure(9, weight=1)
+        m.rowconfigure(10, weight=1)
 
         header = ttk.Frame(m)
         header.grid(row=0, column=0, columnspan=2, sticky="ew", pady=(0, 12))
@@ -210,10 +229,15 @@ class Folderer(tk.Tk):
         ttk.Entry(row, textvariable=self.path).grid(row=0, column=0, sticky="ew")
         ttk.Button(row, text="Browse...", command=self._browse_path).grid(row=0, column=1, padx=(10, 0))
 
+        ttk.Label(m, text="Template (optional):").grid(row=3, column=0, sticky="w", padx=(0, 10), pady=(0, 8))
+        row = ttk.Frame(m); row.grid(row=3, column=1, sticky="ew", pady=(0, 8)); row.columnconfigure(0, weight=1)
+        ttk.Entry(row, textvariable=self.template).grid(row=0, column=0, sticky="ew")
+        ttk.Button(row, text="Browse...", command=self._browse_template).grid(row=0, column=1, padx=(10, 0))
+
         ttk.Checkbutton(m, text="Number folders (Name 1, Name 2, ...)", variable=self.numbered)\
-            .grid(row=3, column=0, columnspan=2, sticky="w", pady=(2, 10))
+            .grid(row=4, column=0, columnspan=2, sticky="w", pady=(2, 10))
 
-        opts = ttk.Frame(m); opts.grid(row=4, column=0, columnspan=2, sticky="ew", pady=(0, 10))
+        opts = ttk.Frame(m); opts.grid(row=5, column=0, columnspan=2, sticky="ew", pady=(0, 10))
         opts.columnconfigure(7, weight=1)
 
         def spin(lbl, var, frm, to, c, w=8, padx=(6, 18)):
@@ -236,24 +260,26 @@ class Folderer(tk.Tk):
             try: sp.configure(validate="key", validatecommand=vcmd)
             except tk.TclError: pass
 
-        ttk.Label(m, text="Preview:").grid(row=5, column=0, sticky="w", padx=(0, 10), pady=(0, 6))
+        ttk.Label(m, text="Preview:").grid(row=6, column=0, sticky="w", padx=(0, 10), pady=(0, 6))
         self.preview = ttk.Label(m, text="", justify="left", wraplength=520)
-        self.preview.grid(row=5, column=1, sticky="ew", pady=(0, 6))
+        self.preview.grid(row=6, column=1, sticky="ew", pady=(0, 6))
 
-        btns = ttk.Frame(m); btns.grid(row=6, column=0, columnspan=2, sticky="ew", pady=(6, 10))
-        btns.columnconfigure(3, weight=1)
+        btns = ttk.Frame(m); btns.grid(row=7, column=0, columnspan=2, sticky="ew", pady=(6, 10))
+        btns.columnconfigure(4, weight=1)
         ttk.Button(btns, text="Create Folders", command=self._create).grid(row=0, column=0, padx=(0, 10))
         ttk.Button(btns, text="Open Target Folder", command=self._open_target).grid(row=0, column=1, padx=(0, 10))
         ttk.Button(btns, text="Folder Files", command=self._folder_files_here).grid(row=0, column=2)
-        ttk.Button(btns, text="Clear Log", command=lambda: self._set_log("")).grid(row=0, column=4, sticky="e")
+        ttk.Combobox(btns, textvariable=self.folder_mode, values=self.FOLDER_MODES, state="readonly", width=9)\
+            .grid(row=0, column=3, padx=(6, 0))
+        ttk.Button(btns, text="Clear Log", command=lambda: self._set_log("")).grid(row=0, column=5, sticky="e")
 
-        ttk.Label(m, text="Log:").grid(row=7, column=0, sticky="w", padx=(0, 10), pady=(0, 6))
+        ttk.Label(m, text="Log:").grid(row=8, column=0, sticky="w", padx=(0, 10), pady=(0, 6))
         self.log = ScrolledText(m, height=10, wrap="word")
-        self.log.grid(row=9, column=0, columnspan=2, sticky="nsew")
+        self.log.grid(row=10, column=0, columnspan=2, sticky="nsew")
         self._set_log("", append=False)
 
         self.tip = ttk.Label(m, text="Tip: If numbering is OFF, only 1 folder can be created (duplicates aren’t possible on Windows).")
-        self.tip.grid(row=10, column=0, columnspan=2, sticky="w", pady=(10, 0))
+        self.tip.grid(row=11, column=0, columnspan=2, sticky="w", pady=(10, 0))
 
     def _ui_settings(self):
         s = self.settings
@@ -501,7 +527,7 @@ class Folderer(tk.Tk):
         self.preview.configure(wraplength=max(260, (self.winfo_width() or 760) - 260))
         base = (self.base.get() or "").strip() or "New Folder"
         if not self.numbered.get():
-            self.preview.config(text=base)
+            self.preview.config(text=base + self._counts_text([base], 1))
             return
         count = self._clamp(self._int(self.count.get(), 1), 1, 9999)
         start = self._clamp(self._int(self.start.get(), 1), 0, 999999)
@@ -509,7 +535,59 @@ class Folderer(tk.Tk):
         sep = self.sep.get()
         n = min(self._examples_n(), count)
         items = [f"{base}{sep}{self._pad_num(start + i, padw)}" for i in range(n)]
-        self.preview.config(text=", ".join(items) + (", ..." if count > n else ""))
+        names = (f"{base}{sep}{self._pad_num(start + i, padw)}" for i in range(count))
+        self.preview.config(text=", ".join(items) + (", ..." if count > n else "") + self._counts_text(names, count))
+
+    def _counts_text(self, names, total):
+        existing = self._target_names()
+        hit = sum(1 for x in names if os.path.normcase(x) in existing) if existing else 0
+        return f"\n{total - hit} new / {hit} existing"
+
+    # ---------- Target snapshot ----------
+    def _preview_target(self):
+        try: return Path(self.path.get()).expanduser().resolve()
+        except Exception: return None
+
+    @staticmethod
+    def _scan_target(target: Path):
+        mtime = target.stat().st_mtime_ns  # taken first so a change mid-scan forces another rebuild
+        with os.scandir(target) as it:
+            names = frozenset(os.path.normcase(e.name) for e in it)
+        return target, mtime, names
+
+    def _target_names(self):
+        # One stat per preview; the single scandir only reruns when the target or its mtime changes
+        target = self._preview_target()
+        try:
+            mtime = target.stat().st_mtime_ns
+        except Exception:
+            self._snap = None
+            return frozenset()
+        snap = self._snap
+        if snap is None or snap[0] != target or snap[1] != mtime:
+            try: snap = self._snap = self._scan_target(target)
+            except Exception: return frozenset()
+        return snap[2]
+
+    def _snapshot_tick(self):
+        # Periodic rescan off the UI thread, for changes an mtime check can miss (coarse timestamps)
+        target = self._preview_target()
+        if target is not None and not self._snap_busy:
+            self._snap_busy = True
+
+            def worker():
+                try: snap = self._scan_target(target)
+                except Exception: snap = None
+                self.after(0, lambda: self._finish_snapshot(snap))
+
+            threading.Thread(target=worker, daemon=True).start()
+        self.after(self.SNAPSHOT_REFRESH_MS, self._snapshot_tick)
+
+    def _finish_snapshot(self, snap):
+        self._snap_busy = False
+        if snap and snap != self._snap and snap[0] == self._preview_target():
+            self._snap = snap
+            self._schedule_preview()
 
     def _set_log(self, text, append=False):
         self.log.configure(state="normal")
@@ -533,6 +611,63 @@ class Folderer(tk.Tk):
                 return cand
             i += 1
 
+    @classmethod
+    def _reflink(cls, src: str, dst: str):
+        if fcntl is None:
+            raise OSError(errno.EOPNOTSUPP, "Reflinks aren't supported on this platform")
+        fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            with open(src, "rb") as f:
+                fcntl.ioctl(fd, cls.FICLONE, f.fileno())
+        except Exception:
+            os.close(fd)
+            os.unlink(dst)
+            raise
+        os.close(fd)
+
+    def _link_file(self, src: str, dst: str, chain):
+        # Try each link kind in turn; returns (kind, why the earlier kinds were skipped)
+        why = ""
+        for i, kind in enumerate(chain):
+            try:
+                if kind == "hardlink": os.link(src, dst)
+                elif kind == "reflink":
+                    self._reflink(src, dst)
+                    shutil.copystat(src, dst)  # a clone is a new inode: carry over mode and times
+                else: os.symlink(src, dst)
+                return kind, why
+            except OSError as e:
+                if i == len(chain) - 1 or e.errno not in self.LINK_FALLBACK_ERRNOS:
+                    raise
+                why = f"{kind} failed: {e.strerror or e}"
+
+    @staticmethod
+    def _is_link_to(src: str, dst: str, clone: bool) -> bool:
+        # A reflink is its own inode, so with clone=True an identical regular file also counts
+        try:
+            if os.path.islink(dst):
+                return os.readlink(dst) == src
+            if os.path.samefile(src, dst):
+                return True
+            return clone and os.path.isfile(dst) and os.path.getsize(src) == os.path.getsize(dst) \
+                and filecmp.cmp(src, dst, shallow=False)
+        except OSError:
+            return False
+
+    def _link_unique(self, src: str, dest: Path, chain):
+        # Same naming as _unique_dest_path, but lets the link call detect collisions (no extra stat).
+        # A collision that is already our link to src (from an earlier run) returns kind None.
+        stem, suffix, parent = dest.stem, dest.suffix, dest.parent
+        cand, i = dest, 0
+        while True:
+            try:
+                return (cand,) + self._link_file(src, str(cand), chain)
+            except FileExistsError:
+                if self._is_link_to(src, str(cand), "reflink" in chain):
+                    return cand, None, ""
+                i += 1
+                cand = parent / f"{stem} ({i}){suffix}"
+
     def _folder_files_here(self):
         try:
             target = Path(self.path.get()).expanduser().resolve()
@@ -541,30 +676,158 @@ class Folderer(tk.Tk):
         if not target.exists():
             return self._error("Path not found", f"This path doesn't exist:\n{target}")
 
-        msg = (
-            "This will move every file in the selected folder into its own\n"
-            "folder named after the file (without extension).\n\n"
-            f"Target:\n{target}\n\nContinue?"
-        )
+        mode = self.folder_mode.get()
+        if mode not in self.FOLDER_MODES:
+            mode = "Move"
+
+        if mode == "Move":
+            msg = (
+                "This will move every file in the selected folder into its own\n"
+                "folder named after the file (without extension).\n\n"
+                f"Target:\n{target}\n\nContinue?"
+            )
+        else:
+            msg = (
+                f"This will {mode.lower()} every file in the selected folder into its own\n"
+                "folder named after the file (without extension).\n"
+                "The original files stay where they are.\n\n"
+                f"Target:\n{target}\n\nContinue?"
+            )
         if not self._confirm_with_dont_show("Folder files?", msg, "warn_folder_files_confirm", icon_text="!"):
             return
 
-        moved = errors = 0
-        for p in target.iterdir():
-            if not p.is_file():
-                continue
+        with os.scandir(target) as it:
+            files = [e for e in it if e.is_file()]
+
+        chain = self.LINK_CHAINS.get(mode, ())
+        if "reflink" in chain and files:
+            # Probe once per job rather than failing a clone (and logging it) for every file
+            try:
+                reflink = self._reflink_works(files[0].path, target)
+            except OSError as e:
+                return self._error("Error", f"Couldn't test reflink support in:\n{target}\n\n{e}")
+            if not reflink:
+                chain = tuple(k for k in chain if k != "reflink")
+                self._set_log(f"⚠️ Reflinks aren't supported here, using {chain[0]}s instead: {target}\n", append=True)
+
+        done = skipped = errors = 0
+        for e in files:
+            p = Path(e.path)
             dest_folder = target / p.stem
             try:
                 dest_folder.mkdir(exist_ok=True)
-                dest_file = self._unique_dest_path(dest_folder / p.name)
-                shutil.move(str(p), str(dest_file))
-                moved += 1
-                self._set_log(f"📦 Moved: {p.name} -> {dest_folder.name}\\{dest_file.name}\n", append=True)
-            except Exception as e:
+                if mode == "Move":
+                    dest_file = self._unique_dest_path(dest_folder / p.name)
+                    shutil.move(str(p), str(dest_file))
+                    self._set_log(f"📦 Moved: {p.name} -> {dest_folder.name}\\{dest_file.name}\n", append=True)
+                else:
+                    dest_file, kind, why = self._link_unique(str(p), dest_folder / p.name, chain)
+                    if kind is None:
+                        skipped += 1
+                        self._set_log(f"⚠️ Already linked (skipped): {p.name} -> {dest_folder.name}\\{dest_file.name}\n", append=True)
+                        continue
+                    note = f"{kind}; {why}" if why else kind
+                    self._set_log(f"🔗 Linked ({note}): {p.name} -> {dest_folder.name}\\{dest_file.name}\n", append=True)
+                done += 1
+            except Exception as ex:
                 errors += 1
-                self._set_log(f"❌ Error: {p.name} -> {e}\n", append=True)
+                self._set_log(f"❌ Error: {p.name} -> {ex}\n", append=True)
 
-        self._info("Done", f"Moved: {moved}\nErrors: {errors}\n\nTarget:\n{target}")
+        summary = f"Moved: {done}" if mode == "Move" else f"Linked: {done}\nAlready linked: {skipped}"
+        self._schedule_preview()
+        self._info("Done", f"{summary}\nErrors: {errors}\n\nTarget:\n{target}")
+
+    # ---------- Template seeding ----------
+    @staticmethod
+    def _scan_template(root: Path):
+        # One walk of the template: relative dirs parent-first, (relative file, size, mode, atime_ns, mtime_ns),
+        # and symlinks as (relative path, link target, points at a dir) so they're recreated as symlinks
+        dirs, files, links = [], [], []
+        stack = [""]
+        while stack:
+            rel = stack.pop()
+            with os.scandir(root / rel if rel else root) as it:
+                for e in it:
+                    r = os.path.join(rel, e.name)
+                    if e.is_symlink():
+                        links.append((r, os.readlink(e.path), e.is_dir()))
+                    elif e.is_dir():
+                        dirs.append(r)
+                        stack.append(r)
+                    elif e.is_file():
+                        st = e.stat()
+                        files.append((r, st.st_size, st.st_mode, st.st_atime_ns, st.st_mtime_ns))
+        return dirs, files, links
+
+    def _reflink_works(self, src: str, folder: Path) -> bool:
+        # Probed once per job so filesystems without reflinks don't pay a failed clone per file
+        if fcntl is None:
+            return False
+        probe = folder / ".folderer-reflink-probe"
+        try:
+            self._reflink(src, str(probe))
+        except OSError:
+            return False
+        os.unlink(probe)
+        return True
+
+    @classmethod
+    def _clone_file(cls, src: str, dst: str, size: int, reflink: bool):
+        # Reflink if the filesystem can, else let the kernel copy (copy_file_range), else shutil
+        if reflink:
+            try:
+                return cls._reflink(src, dst)
+            except FileExistsError:
+                raise
+            except OSError:
+                pass
+        if hasattr(os, "copy_file_range"):
+            try:
+                with open(src, "rb") as fs, open(dst, "xb") as fd:
+                    # The scanned size is only a hint; copy until EOF in case the file grew since
+                    chunk = max(size, 1 << 30)
+                    while os.copy_file_range(fs.fileno(), fd.fileno(), chunk):
+                        pass
+                return
+            except FileExistsError:
+                raise
+            except OSError:
+                pass
+        shutil.copyfile(src, dst)
+
+    def _seed_folder(self, folder: Path, root: Path, manifest, reflink: bool):
+        dirs, files, links = manifest
+        n = 0
+        try:
+            for r in dirs:
+                (folder / r).mkdir(exist_ok=True)
+            for r, size, mode, at, mt in files:
+                dst = str(folder / r)
+                self._clone_file(str(root / r), dst, size, reflink)
+                os.chmod(dst, mode & 0o7777)
+                os.utime(dst, ns=(at, mt))
+                n += 1
+            for r, link, is_dir in links:
+                os.symlink(link, folder / r, target_is_directory=is_dir)
+                n += 1
+            return folder, n, None
+        except Exception as e:
+            return folder, n, e
+
+    def _seed_folders(self, folders, root: Path, manifest, on_result, on_done):
+        # Runs off the UI thread; each folder's result and the final callback are posted back via after()
+        def worker():
+            try:
+                files = manifest[1]
+                reflink = bool(files) and self._reflink_works(str(root / files[0][0]), folders[0])
+                with ThreadPoolExecutor() as pool:
+                    for res in pool.map(lambda f: self._seed_folder(f, root, manifest, reflink), folders):
+                        self.after(0, lambda r=res: on_result(*r))
+                self.after(0, on_done)
+            except Exception as e:
+                self.after(0, lambda m=str(e): on_done(err=m))
+
+        threading.Thread(target=worker, daemon=True).start()
 
     # ---------- Theme ----------
     def _apply_theme(self):
@@ -647,6 +910,10 @@ class Folderer(tk.Tk):
         d = filedialog.askdirectory(title="Choose a folder", initialdir=self.path.get() or None)
         if d: self.path.set(d)
 
+    def _browse_template(self):
+        d = filedialog.askdirectory(title="Choose a template folder", initialdir=self.template.get() or None)
+        if d: self.template.set(d)
+
     def _browse_default_path(self):
         d = filedialog.askdirectory(title='Choose default "Create in" folder', initialdir=self.default_path.get() or None)
         if d: self.default_path.set(d)
@@ -661,6 +928,8 @@ class Folderer(tk.Tk):
             self._error("Error", str(e))
 
     def _create(self):
+        if self._seeding:
+            return self._warn("Busy", "Still seeding folders from the template.\nTry again when it's done.")
         base = (self.base.get() or "").strip()
         if not base:
             return self._error("Missing name", "Folder base name can't be empty.")
@@ -669,6 +938,19 @@ class Folderer(tk.Tk):
         except Exception:
             return self._error("Bad path", "That path doesn't look valid.")
 
+        template = manifest = None
+        if (self.template.get() or "").strip():
+            try:
+                template = Path(self.template.get().strip()).expanduser().resolve()
+            except Exception:
+                return self._error("Bad template", "That template path doesn't look valid.")
+            if not template.is_dir():
+                return self._error("Template not found", f"This template folder doesn't exist:\n{template}")
+            try:
+                manifest = self._scan_template(template)
+            except Exception as e:
+                return self._error("Template error", f"Couldn't read the template folder:\n{template}\n\n{e}")
+
         if not target.exists():
             if not self._ask("Create path?", f"This folder doesn't exist:\n{target}\n\nCreate it?"):
                 return
@@ -698,11 +980,13 @@ class Folderer(tk.Tk):
             names = [base]
 
         made = skipped = 0
+        created = []
         for name in names:
             p = target / name
             try:
                 p.mkdir(exist_ok=False)
                 made += 1
+                created.append(p)
                 self._set_log(f"✅ Created: {p}\n", append=True)
             except FileExistsError:
                 skipped += 1
@@ -710,6 +994,33 @@ class Folderer(tk.Tk):
             except Exception as e:
                 self._set_log(f"❌ Error: {p} -> {e}\n", append=True)
 
+        if template and created:
+            tally = {"ok": 0, "files": 0}
+
+            def on_result(folder, n, err):
+                tally["files"] += n
+                if err:
+                    self._set_log(f"❌ Seed error: {folder} -> {err}\n", append=True)
+                else:
+                    tally["ok"] += 1
+
+            def on_done(err=""):
+                self._seeding = False
+                ok, files = tally["ok"], tally["files"]
+                if err:
+                    self._set_log(f"❌ Seeding failed: {template} -> {err}\n", append=True)
+                    self._schedule_preview()
+                    return self._error("Seeding failed", f"Couldn’t seed folders from the template.\n\n{err}\n\n"
+                                       f"Created: {made}\nSeeded: {ok} ({files} files)\n\nPath:\n{target}")
+                self._set_log(f"🌱 Seeded {ok} folder(s), {files} file(s) from template: {template}\n", append=True)
+                self._schedule_preview()
+                self._info("Done", f"Created: {made}\nSkipped: {skipped}\nSeeded: {ok} ({files} files)\n\nPath:\n{target}")
+
+            self._seeding = True
+            self._set_log(f"🌱 Seeding {len(created)} folder(s) from template: {template}\n", append=True)
+            return self._seed_folders(created, template, manifest, on_result, on_done)
+
+        self._schedule_preview()
         self._info("Done", f"Created: {made}\nSkipped: {skipped}\n\nPath:\n{target}")
 
 